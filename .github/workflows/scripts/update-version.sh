@@ -42,6 +42,14 @@ CURRENT_VERSION=$(grep -oE -- '--version [0-9]+\.[0-9]+\.[0-9]+' README.md | hea
 echo "Current version in README.md: ${CURRENT_VERSION}"
 echo "New version from tag: ${VERSION}"
 
+# Nothing to do if README.md already has this exact version, including any
+# pre-release suffix (e.g. 0.3.0-rc.1 must still be updated to 0.3.0)
+CURRENT_FULL_VERSION=$(grep -oE -- '--version [0-9]+\.[0-9]+\.[0-9]+[^ ]*' README.md | head -1 | sed 's/--version //')
+if [ "${CURRENT_FULL_VERSION}" = "${VERSION}" ]; then
+  echo "README.md already has version ${VERSION}. Skipping update."
+  exit 0
+fi
+
 # Compare versions using sort -V (version sort)
 HIGHER_VERSION=$(printf '%s\n%s' "${CURRENT_VERSION}" "${VERSION}" | sort -V | tail -1)
 